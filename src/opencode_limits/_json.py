@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(payload: Any, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0
+        return orjson.dumps(payload, option=option)
+    if pretty:
+        return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
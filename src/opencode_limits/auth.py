@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from opencode_limits import _json
+
 AUTH_PATH = Path("~/.local/share/opencode/auth.json").expanduser()
 
 
@@ -19,17 +20,25 @@ class AuthTokens:
     chatgpt_account_id: str
 
 
+_AUTH_CACHE: dict[tuple[str, int, int], AuthTokens] = {}
+
+
 def _load_json(path: Path) -> dict[str, Any]:
     try:
-        return json.loads(path.read_text())
+        return _json.loads(path.read_bytes())
     except FileNotFoundError as exc:
         raise AuthError(f"Auth file not found at {path}") from exc
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:
         raise AuthError(f"Auth file at {path} is not valid JSON") from exc
 
 
 def load_auth(path: Path | None = None) -> AuthTokens:
     auth_path = path or AUTH_PATH
+    cache_key = _cache_key(auth_path)
+    if cache_key is not None:
+        cached = _AUTH_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
     data = _load_json(auth_path)
 
     openai_token, account_id = _extract_openai(data)
@@ -46,11 +55,22 @@ def load_auth(path: Path | None = None) -> AuthTokens:
         missing_text = ", ".join(missing)
         raise AuthError(f"Auth file missing required keys: {missing_text}")
 
-    return AuthTokens(
+    tokens = AuthTokens(
         openai=str(openai_token),
         github_copilot=str(github_copilot),
         chatgpt_account_id=str(account_id),
     )
+    if cache_key is not None:
+        _AUTH_CACHE[cache_key] = tokens
+    return tokens
+
+
+def _cache_key(path: Path) -> tuple[str, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def _extract_openai(data: dict[str, Any]) -> tuple[str | None, str | None]:
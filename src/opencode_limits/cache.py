@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable
 
+try:
+    import blake3
+except ImportError:  # pragma: no cover - exercised only when blake3 is absent
+    blake3 = None
+
+from opencode_limits import _json
 from opencode_limits.auth import AuthTokens
 from opencode_limits.models import UsageWindow, parse_timestamp
 
 DEFAULT_CACHE_TTL_SECONDS = 180
 STALE_FALLBACK_SECONDS = 24 * 60 * 60
-FORMAT_VERSION = 1
+FORMAT_VERSION = 2
 
 
 @dataclass(frozen=True)
@@ -29,6 +35,14 @@ class CacheRecord:
     copilot: CachedWindow | None
     auth_fingerprint: str
     format_version: int = FORMAT_VERSION
+    github_login: str | None = None
+    min_reset_at: datetime | None = None
+
+    def __post_init__(self) -> None:
+        if self.min_reset_at is None:
+            object.__setattr__(
+                self, "min_reset_at", _earliest_reset(self.codex, self.copilot)
+            )
 
 
 def cache_path(override: str | None = None) -> Path:
@@ -39,14 +53,18 @@ def cache_path(override: str | None = None) -> Path:
     return base / "opencode-limits" / "tmux.json"
 
 
+@lru_cache(maxsize=4)
 def build_auth_fingerprint(tokens: AuthTokens) -> str:
-    digest = hashlib.sha256()
-    digest.update(tokens.openai.encode("utf-8"))
-    digest.update(b":")
-    digest.update(tokens.github_copilot.encode("utf-8"))
-    digest.update(b":")
-    digest.update(tokens.chatgpt_account_id.encode("utf-8"))
-    return digest.hexdigest()
+    payload = b":".join(
+        (
+            tokens.openai.encode("utf-8"),
+            tokens.github_copilot.encode("utf-8"),
+            tokens.chatgpt_account_id.encode("utf-8"),
+        )
+    )
+    if blake3 is not None:
+        return blake3.blake3(payload).hexdigest()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
 
 def build_cache_record(
@@ -54,6 +72,7 @@ def build_cache_record(
     copilot_window: UsageWindow | None,
     tokens: AuthTokens,
     fetched_at: datetime | None = None,
+    github_login: str | None = None,
 ) -> CacheRecord:
     codex: dict[str, CachedWindow] = {}
     for window in codex_windows or []:
@@ -69,15 +88,24 @@ def build_cache_record(
         copilot=copilot,
         auth_fingerprint=build_auth_fingerprint(tokens),
         format_version=FORMAT_VERSION,
+        github_login=github_login,
     )
 
 
+def peek_cache_fetched_at(path: Path) -> datetime | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+
+
 def load_cache(path: Path) -> CacheRecord | None:
     try:
-        payload = json.loads(path.read_text())
+        payload = _json.loads(path.read_bytes())
     except FileNotFoundError:
         return None
-    except (OSError, json.JSONDecodeError):
+    except (OSError, ValueError):
         return None
 
     if not isinstance(payload, dict):
@@ -103,6 +131,7 @@ def load_cache(path: Path) -> CacheRecord | None:
                 codex[str(label)] = window
 
     copilot = _parse_cached_window(payload.get("copilot"))
+    github_login = payload.get("github_login")
 
     return CacheRecord(
         fetched_at=fetched_at,
@@ -110,13 +139,21 @@ def load_cache(path: Path) -> CacheRecord | None:
         copilot=copilot,
         auth_fingerprint=str(auth_fingerprint),
         format_version=format_version_int,
+        github_login=str(github_login) if github_login else None,
     )
 
 
 def save_cache(path: Path, record: CacheRecord) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    pretty = os.environ.get("OPENCODE_LIMITS_DEBUG") == "1"
+    if _json.orjson is not None:
+        # orjson serializes dataclasses (and datetimes) natively, so the
+        # record can be written without materializing an intermediate dict.
+        path.write_bytes(_json.dumps(record, pretty=pretty))
+        _stamp_fetched_at(path, record)
+        return
     payload = {
-        "fetched_at": record.fetched_at.astimezone(timezone.utc).isoformat(),
+        "fetched_at": _isoformat_utc(record.fetched_at),
         "codex": {
             label: _serialize_cached_window(window)
             for label, window in record.codex.items()
@@ -124,28 +161,45 @@ def save_cache(path: Path, record: CacheRecord) -> None:
         "copilot": _serialize_cached_window(record.copilot),
         "auth_fingerprint": record.auth_fingerprint,
         "format_version": record.format_version,
+        "github_login": record.github_login,
     }
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+    path.write_bytes(_json.dumps(payload, pretty=pretty))
+    _stamp_fetched_at(path, record)
 
 
-def is_fresh(
+def _stamp_fetched_at(path: Path, record: CacheRecord) -> None:
+    # Mirror fetched_at into the file mtime so freshness can be gated on a
+    # bare stat without reading and parsing the file.
+    timestamp = record.fetched_at.timestamp()
+    os.utime(path, (timestamp, timestamp))
+
+
+def cache_age(
     record: CacheRecord,
-    ttl_seconds: int,
     auth_fingerprint: str,
     format_version: int = FORMAT_VERSION,
     now: datetime | None = None,
-) -> bool:
+) -> float | None:
+    """Age of the record in seconds, or None if it can never be used."""
     if record.format_version != format_version:
-        return False
+        return None
     if record.auth_fingerprint != auth_fingerprint:
-        return False
+        return None
     current = now or datetime.now(timezone.utc)
-    age_seconds = (current - record.fetched_at).total_seconds()
-    if age_seconds > ttl_seconds:
-        return False
     if _has_reset_passed(record, current):
-        return False
-    return True
+        return None
+    return (current - record.fetched_at).total_seconds()
+
+
+def is_fresh(
+    record: CacheRecord,
+    ttl_seconds: int,
+    auth_fingerprint: str,
+    format_version: int = FORMAT_VERSION,
+    now: datetime | None = None,
+) -> bool:
+    age = cache_age(record, auth_fingerprint, format_version, now)
+    return age is not None and age <= ttl_seconds
 
 
 def is_stale_allowed(
@@ -155,17 +209,8 @@ def is_stale_allowed(
     format_version: int = FORMAT_VERSION,
     now: datetime | None = None,
 ) -> bool:
-    if record.format_version != format_version:
-        return False
-    if record.auth_fingerprint != auth_fingerprint:
-        return False
-    current = now or datetime.now(timezone.utc)
-    age_seconds = (current - record.fetched_at).total_seconds()
-    if age_seconds > max_age_seconds:
-        return False
-    if _has_reset_passed(record, current):
-        return False
-    return True
+    age = cache_age(record, auth_fingerprint, format_version, now)
+    return age is not None and age <= max_age_seconds
 
 
 def _parse_cached_window(payload: Any) -> CachedWindow | None:
@@ -185,14 +230,16 @@ def _parse_cached_window(payload: Any) -> CachedWindow | None:
 def _serialize_cached_window(window: CachedWindow | None) -> dict[str, Any] | None:
     if window is None:
         return None
-    reset_at = (
-        window.reset_at.astimezone(timezone.utc).isoformat()
-        if window.reset_at
-        else None
-    )
+    reset_at = _isoformat_utc(window.reset_at) if window.reset_at else None
     return {"used_percent": window.used_percent, "reset_at": reset_at}
 
 
+def _isoformat_utc(value: datetime) -> str:
+    if value.tzinfo is not timezone.utc:
+        value = value.astimezone(timezone.utc)
+    return value.isoformat()
+
+
 def _to_cached_window(window: UsageWindow) -> CachedWindow:
     return CachedWindow(used_percent=window.used_percent, reset_at=window.reset_at)
 
@@ -206,10 +253,14 @@ def _normalize_codex_label(label: str) -> str | None:
     return None
 
 
+def _earliest_reset(
+    codex: dict[str, CachedWindow], copilot: CachedWindow | None
+) -> datetime | None:
+    resets = [window.reset_at for window in codex.values() if window.reset_at]
+    if copilot and copilot.reset_at:
+        resets.append(copilot.reset_at)
+    return min(resets, default=None)
+
+
 def _has_reset_passed(record: CacheRecord, now: datetime) -> bool:
-    for window in record.codex.values():
-        if window.reset_at and window.reset_at <= now:
-            return True
-    if record.copilot and record.copilot.reset_at and record.copilot.reset_at <= now:
-        return True
-    return False
+    return record.min_reset_at is not None and record.min_reset_at <= now
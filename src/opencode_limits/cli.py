@@ -1,30 +1,32 @@
 from __future__ import annotations
 
 import argparse
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
-from typing import Sequence
-
-import httpx
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+import sys
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Sequence
 
 from opencode_limits.auth import AuthError, AuthTokens, load_auth
 from opencode_limits.cache import (
     STALE_FALLBACK_SECONDS,
-    CacheRecord,
     build_auth_fingerprint,
     build_cache_record,
     cache_path,
     is_fresh,
     is_stale_allowed,
     load_cache,
+    peek_cache_fetched_at,
     save_cache,
 )
 from opencode_limits.models import UsageWindow
-from opencode_limits.providers.codex import fetch_codex_usage
-from opencode_limits.providers.copilot import fetch_copilot_usage
-from opencode_limits.render import render_sections
-from opencode_limits.tmux import load_cache_settings, render_tmux_status
+from opencode_limits.tmux import (
+    load_cache_settings,
+    render_tmux_status,
+    render_tmux_status_cached,
+)
+
+if TYPE_CHECKING:
+    import httpx
+    from rich.console import Console
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -37,18 +39,35 @@ def main(argv: Sequence[str] | None = None) -> int:
         action="store_true",
         help="Print tmux-ready usage status line.",
     )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=("daemon",),
+        help="Run as a background refresh daemon serving tmux status.",
+    )
     args = parser.parse_args(argv)
 
-    console = Console()
     try:
         tokens = load_auth()
     except AuthError as exc:
-        _print_error(console, str(exc))
+        _print_error(str(exc))
         return 1
 
     if args.tmux:
-        return _run_tmux(console, tokens)
+        from opencode_limits.daemon import read_status
 
+        status = read_status(fingerprint=build_auth_fingerprint(tokens))
+        if status:
+            sys.stdout.write(status)
+            return 0
+        return _run_tmux(tokens)
+
+    if args.command == "daemon":
+        return _run_daemon(tokens)
+
+    from rich.console import Console
+
+    console = Console()
     codex_windows, copilot_window, failures = _fetch_usage(console, tokens)
 
     sections: list[tuple[str, list[UsageWindow]]] = []
@@ -57,10 +76,12 @@ def main(argv: Sequence[str] | None = None) -> int:
     if copilot_window is not None:
         sections.append(("GitHub Copilot", [copilot_window]))
     if sections:
+        from opencode_limits.render import render_sections
+
         render_sections(console, sections)
 
     for message in failures:
-        _print_error(console, message)
+        _print_error(message, console)
 
     if not codex_windows and copilot_window is None:
         return 1
@@ -71,7 +92,11 @@ if __name__ == "__main__":
     raise SystemExit(main())
 
 
-def _print_error(console: Console, message: str) -> None:
+def _print_error(message: str, console: Console | None = None) -> None:
+    if console is None:
+        from rich.console import Console
+
+        console = Console()
     if console.is_terminal:
         console.print(f"[red]{message}[/red]")
     else:
@@ -79,10 +104,31 @@ def _print_error(console: Console, message: str) -> None:
 
 
 def _fetch_usage(
-    console: Console,
+    console: Console | None,
     tokens: AuthTokens,
     show_progress: bool = True,
+    github_login: str | None = None,
+) -> tuple[list[UsageWindow], UsageWindow | None, list[str]]:
+    import asyncio
+
+    return asyncio.run(
+        _fetch_usage_async(console, tokens, show_progress, github_login)
+    )
+
+
+async def _fetch_usage_async(
+    console: Console | None,
+    tokens: AuthTokens,
+    show_progress: bool,
+    github_login: str | None = None,
 ) -> tuple[list[UsageWindow], UsageWindow | None, list[str]]:
+    import asyncio
+
+    import httpx
+
+    from opencode_limits.providers.codex import fetch_codex_usage
+    from opencode_limits.providers.copilot import fetch_copilot_usage
+
     codex_windows: list[UsageWindow] = []
     copilot_window: UsageWindow | None = None
     failures: list[str] = []
@@ -94,104 +140,137 @@ def _fetch_usage(
         else:
             copilot_window = result
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        future_map = {
-            executor.submit(fetch_codex_usage, tokens): "Codex",
-            executor.submit(fetch_copilot_usage, tokens): "GitHub Copilot",
+    def collect_result(name: str, task: asyncio.Task) -> None:
+        try:
+            result = task.result()
+        except (httpx.HTTPError, RuntimeError) as exc:
+            failures.append(f"{name} failed: {exc}")
+        else:
+            store_result(name, result)
+
+    async with _build_client() as client:
+        task_map = {
+            asyncio.ensure_future(fetch_codex_usage(tokens, client)): "Codex",
+            asyncio.ensure_future(
+                fetch_copilot_usage(tokens, client, github_login=github_login)
+            ): "GitHub Copilot",
         }
 
-        if show_progress and console.is_terminal:
+        if show_progress and console is not None and console.is_terminal:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
             progress = Progress(
                 SpinnerColumn(finished_text="✔"),
                 TextColumn("{task.description}"),
                 transient=False,
             )
             task_ids = {
-                name: progress.add_task(name, total=1) for name in future_map.values()
+                name: progress.add_task(name, total=1) for name in task_map.values()
             }
             with progress:
-                while future_map:
-                    done, _ = wait(future_map, timeout=0.1, return_when=FIRST_COMPLETED)
-                    for future in done:
-                        name = future_map.pop(future)
-                        task_id = task_ids[name]
-                        try:
-                            result = future.result()
-                        except (httpx.HTTPError, RuntimeError) as exc:
-                            failures.append(f"{name} failed: {exc}")
-                            progress.update(task_id, completed=1)
-                        else:
-                            store_result(name, result)
-                            progress.update(task_id, completed=1)
+                pending = set(task_map)
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        name = task_map[task]
+                        collect_result(name, task)
+                        progress.update(task_ids[name], completed=1)
         else:
-            for future, name in list(future_map.items()):
-                try:
-                    result = future.result()
-                except (httpx.HTTPError, RuntimeError) as exc:
-                    failures.append(f"{name} failed: {exc}")
-                else:
-                    store_result(name, result)
+            await asyncio.gather(*task_map, return_exceptions=True)
+            for task, name in task_map.items():
+                collect_result(name, task)
 
     return codex_windows, copilot_window, failures
 
 
-def _run_tmux(console: Console, tokens: AuthTokens) -> int:
+def _build_client() -> httpx.AsyncClient:
+    import httpx
+
+    limits = httpx.Limits(max_keepalive_connections=4)
+    try:
+        return httpx.AsyncClient(http2=True, limits=limits, timeout=10.0)
+    except ImportError:
+        return httpx.AsyncClient(limits=limits, timeout=10.0)
+
+
+def _run_daemon(tokens: AuthTokens) -> int:
+    from opencode_limits.daemon import run_daemon
+
+    settings = load_cache_settings()
+
+    def refresh() -> str:
+        codex_windows, copilot_window, _ = _fetch_usage(
+            None, tokens, show_progress=False
+        )
+        return render_tmux_status(codex_windows, copilot_window)
+
+    return run_daemon(
+        refresh,
+        settings.ttl_seconds,
+        fingerprint=build_auth_fingerprint(tokens),
+    )
+
+
+def _run_tmux(tokens: AuthTokens) -> int:
     settings = load_cache_settings()
     fingerprint = build_auth_fingerprint(tokens)
     record = None
     cache_file = cache_path(settings.path)
+    now = datetime.now(timezone.utc)
 
     if not settings.disabled and not settings.refresh:
-        record = load_cache(cache_file)
-        if record and is_fresh(record, settings.ttl_seconds, fingerprint):
-            codex_windows, copilot_window = _cached_windows(record)
-            status = render_tmux_status(codex_windows, copilot_window)
-            if status:
-                console.file.write(status)
-                return 0
-            return 1
+        fetched_at = peek_cache_fetched_at(cache_file)
+        if (
+            fetched_at is not None
+            and (now - fetched_at).total_seconds() <= settings.ttl_seconds
+        ):
+            record = load_cache(cache_file)
+            if record and is_fresh(
+                record, settings.ttl_seconds, fingerprint, now=now
+            ):
+                status = render_tmux_status_cached(record.codex, record.copilot)
+                if status:
+                    sys.stdout.write(status)
+                    return 0
+                return 1
+
+    from opencode_limits.providers.copilot import cached_login
 
+    if record is None and not settings.disabled:
+        record = load_cache(cache_file)
+    known_login = (
+        record.github_login
+        if record and record.auth_fingerprint == fingerprint
+        else None
+    )
     codex_windows, copilot_window, failures = _fetch_usage(
-        console, tokens, show_progress=False
+        None, tokens, show_progress=False, github_login=known_login
     )
     if codex_windows or copilot_window is not None:
         status = render_tmux_status(codex_windows, copilot_window)
         if status:
             if not settings.disabled and not failures:
-                record = build_cache_record(codex_windows, copilot_window, tokens)
+                record = build_cache_record(
+                    codex_windows,
+                    copilot_window,
+                    tokens,
+                    github_login=cached_login(tokens) or known_login,
+                )
                 save_cache(cache_file, record)
-            console.file.write(status)
+            sys.stdout.write(status)
             return 0
 
     if not settings.disabled:
         if record is None:
             record = load_cache(cache_file)
-        if record and is_stale_allowed(record, STALE_FALLBACK_SECONDS, fingerprint):
-            codex_windows, copilot_window = _cached_windows(record)
-            status = render_tmux_status(codex_windows, copilot_window)
+        if record and is_stale_allowed(
+            record, STALE_FALLBACK_SECONDS, fingerprint, now=now
+        ):
+            status = render_tmux_status_cached(record.codex, record.copilot)
             if status:
-                console.file.write(status)
+                sys.stdout.write(status)
                 return 0
 
     return 1
-
-
-def _cached_windows(
-    record: CacheRecord,
-) -> tuple[list[UsageWindow], UsageWindow | None]:
-    codex_windows = [
-        UsageWindow(
-            label=label,
-            used_percent=window.used_percent,
-            reset_at=window.reset_at,
-        )
-        for label, window in record.codex.items()
-    ]
-    copilot_window = None
-    if record.copilot is not None:
-        copilot_window = UsageWindow(
-            label="Copilot",
-            used_percent=record.copilot.used_percent,
-            reset_at=record.copilot.reset_at,
-        )
-    return codex_windows, copilot_window
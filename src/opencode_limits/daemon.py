@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from opencode_limits.cache import STALE_FALLBACK_SECONDS
+
+
+def socket_path() -> Path:
+    root = os.environ.get("XDG_RUNTIME_DIR")
+    base = Path(root) if root else Path(tempfile.gettempdir())
+    return base / "opencode-limits.sock"
+
+
+def read_status(
+    path: Path | None = None,
+    timeout: float = 0.25,
+    fingerprint: str | None = None,
+) -> str | None:
+    target = path or socket_path()
+    chunks: list[bytes] = []
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(target))
+            while True:
+                chunk = client.recv(4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+    # The payload is the daemon's auth fingerprint, a newline, then the
+    # status; a daemon refreshing under different tokens is ignored.
+    header, _, status = b"".join(chunks).decode("utf-8").partition("\n")
+    if fingerprint is not None and header != fingerprint:
+        return None
+    return status or None
+
+
+def run_daemon(
+    refresh: Callable[[], str],
+    ttl_seconds: int,
+    path: Path | None = None,
+    stop: threading.Event | None = None,
+    fingerprint: str = "",
+    max_age_seconds: int = STALE_FALLBACK_SECONDS,
+) -> int:
+    target = path or socket_path()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        target.unlink()
+    except FileNotFoundError:
+        pass
+
+    stopping = stop or threading.Event()
+    status = ""
+    refreshed_at = time.monotonic()
+    status_lock = threading.Lock()
+
+    def refresher() -> None:
+        nonlocal status, refreshed_at
+        while not stopping.is_set():
+            try:
+                fresh = refresh()
+            except Exception:
+                # A failed tick keeps serving the previous status; the next
+                # interval retries rather than killing the thread.
+                fresh = ""
+            if fresh:
+                with status_lock:
+                    status = fresh
+                    refreshed_at = time.monotonic()
+            stopping.wait(ttl_seconds)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(target))
+        server.listen()
+        server.settimeout(0.5)
+        worker = threading.Thread(target=refresher, daemon=True)
+        worker.start()
+        while not stopping.is_set():
+            try:
+                connection, _ = server.accept()
+            except TimeoutError:
+                continue
+            with connection:
+                with status_lock:
+                    payload = status
+                    age = time.monotonic() - refreshed_at
+                if age > max_age_seconds:
+                    # Refreshes have been failing for too long; serve nothing
+                    # so clients fall back to the cache path.
+                    payload = ""
+                try:
+                    connection.sendall(f"{fingerprint}\n{payload}".encode("utf-8"))
+                except OSError:
+                    # Client gave up before reading; serve the next one.
+                    continue
+    finally:
+        server.close()
+        try:
+            target.unlink()
+        except FileNotFoundError:
+            pass
+    return 0
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -21,5 +22,11 @@ def parse_timestamp(value: str | int | float | None) -> datetime | None:
         if seconds > 1_000_000_000_000:
             seconds = seconds / 1000.0
         return datetime.fromtimestamp(seconds, tz=timezone.utc)
-    normalized = str(value).replace("Z", "+00:00")
-    return datetime.fromisoformat(normalized)
+    return _parse_iso(str(value))
+
+
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime:
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
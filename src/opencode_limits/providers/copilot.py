@@ -5,15 +5,20 @@ from typing import Any
 
 import httpx
 
+from opencode_limits import _json
 from opencode_limits.auth import AuthTokens
 from opencode_limits.models import UsageWindow, parse_timestamp
 
 COPILOT_PRO_MONTHLY_LIMIT = 300
 GITHUB_API_URL = "https://api.github.com"
 
+_LOGIN_CACHE: dict[str, str] = {}
 
-def fetch_copilot_usage(
-    tokens: AuthTokens, client: httpx.Client | None = None
+
+async def fetch_copilot_usage(
+    tokens: AuthTokens,
+    client: httpx.AsyncClient | None = None,
+    github_login: str | None = None,
 ) -> UsageWindow:
     headers = {
         "Authorization": f"Bearer {tokens.github_copilot}",
@@ -21,50 +26,72 @@ def fetch_copilot_usage(
         "X-GitHub-Api-Version": "2022-11-28",
         "User-Agent": "opencode-limits",
     }
+    login = github_login or _LOGIN_CACHE.get(tokens.github_copilot)
     if client is None:
-        with httpx.Client(headers=headers, timeout=10.0) as session:
-            return _fetch_with_session(session)
+        async with httpx.AsyncClient(headers=headers, timeout=10.0) as session:
+            window, login = await _fetch_with_session(session, login=login)
+    else:
+        window, login = await _fetch_with_session(client, headers=headers, login=login)
 
-    return _fetch_with_session(client, headers=headers)
+    if login:
+        _LOGIN_CACHE[tokens.github_copilot] = login
+    return window
 
 
-def _fetch_with_session(
-    session: httpx.Client, headers: dict[str, str] | None = None
-) -> UsageWindow:
-    billing_window = _fetch_billing_usage(session, headers=headers)
+def cached_login(tokens: AuthTokens) -> str | None:
+    return _LOGIN_CACHE.get(tokens.github_copilot)
+
+
+async def _fetch_with_session(
+    session: httpx.AsyncClient,
+    headers: dict[str, str] | None = None,
+    login: str | None = None,
+) -> tuple[UsageWindow, str | None]:
+    billing_window, login = await _fetch_billing_usage(
+        session, headers=headers, login=login
+    )
     if billing_window is not None:
-        return billing_window
-    return _fetch_internal_usage(session, headers=headers)
+        return billing_window, login
+    return await _fetch_internal_usage(session, headers=headers), login
 
 
-def _fetch_billing_usage(
-    session: httpx.Client, headers: dict[str, str] | None = None
-) -> UsageWindow | None:
-    user_response = session.get(f"{GITHUB_API_URL}/user", headers=headers)
-    user_response.raise_for_status()
-    login = user_response.json().get("login")
+async def _fetch_billing_usage(
+    session: httpx.AsyncClient,
+    headers: dict[str, str] | None = None,
+    login: str | None = None,
+) -> tuple[UsageWindow | None, str | None]:
+    verified = False
     if not login:
-        raise RuntimeError("GitHub response missing login")
+        user_response = await session.get(f"{GITHUB_API_URL}/user", headers=headers)
+        user_response.raise_for_status()
+        login = _json.loads(user_response.content).get("login")
+        if not login:
+            raise RuntimeError("GitHub response missing login")
+        verified = True
 
     today = date.today()
-    usage_response = session.get(
+    usage_response = await session.get(
         f"{GITHUB_API_URL}/users/{login}/settings/billing/premium_request/usage",
         params={"year": today.year, "month": today.month},
         headers=headers,
     )
     if usage_response.status_code == 404:
-        return None
+        # A seeded login that 404s may belong to different tokens; only a
+        # login confirmed via GET /user is worth caching.
+        return None, login if verified else None
     usage_response.raise_for_status()
-    used = parse_copilot_usage(usage_response.json())
-    return build_copilot_window(used, today=today)
+    used = parse_copilot_usage(_json.loads(usage_response.content))
+    return build_copilot_window(used, today=today), login
 
 
-def _fetch_internal_usage(
-    session: httpx.Client, headers: dict[str, str] | None = None
+async def _fetch_internal_usage(
+    session: httpx.AsyncClient, headers: dict[str, str] | None = None
 ) -> UsageWindow:
-    response = session.get(f"{GITHUB_API_URL}/copilot_internal/user", headers=headers)
+    response = await session.get(
+        f"{GITHUB_API_URL}/copilot_internal/user", headers=headers
+    )
     response.raise_for_status()
-    return parse_copilot_internal(response.json())
+    return parse_copilot_internal(_json.loads(response.content))
 
 
 def parse_copilot_usage(payload: dict[str, Any]) -> float:
@@ -131,6 +158,10 @@ def _next_month_start(current: date) -> datetime:
 def _coerce_number(value: Any) -> float:
     if value is None:
         return 0.0
+    if type(value) is float:
+        return value
+    if type(value) is int:
+        return float(value)
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -1,21 +1,38 @@
 from __future__ import annotations
 
-from rich.console import Console
-from rich.text import Text
+from datetime import datetime, tzinfo
+from typing import TYPE_CHECKING
 
 from opencode_limits.models import UsageWindow
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_BAR_WIDTH = 28
+_BAR_FILLED = tuple("#" * count for count in range(_BAR_WIDTH + 1))
+_BAR_EMPTY = tuple("-" * count for count in range(_BAR_WIDTH + 1))
+
 
 def render_sections(
     console: Console,
     sections: list[tuple[str, list[UsageWindow]]],
 ) -> None:
-    all_windows = [window for _, windows in sections for window in windows]
-    if not all_windows:
+    from rich.markup import escape
+    from rich.text import Text
+
+    suffixes: dict[UsageWindow, str] = {}
+    label_width = 0
+    usage_width = 0
+    for _, windows in sections:
+        for window in windows:
+            suffix = format_usage_suffix(window)
+            suffixes[window] = suffix
+            label_width = max(label_width, len(window.label))
+            usage_width = max(usage_width, len(suffix))
+    if not suffixes:
         return
 
-    label_width = max(len(window.label) for window in all_windows)
-    usage_width = max(len(format_usage_suffix(window)) for window in all_windows)
+    local_tz = datetime.now().astimezone().tzinfo
 
     for index, (title, windows) in enumerate(sections):
         if index:
@@ -28,53 +45,51 @@ def render_sections(
             continue
         for window in windows:
             percent = max(0.0, min(100.0, window.used_percent))
-            reset_text = format_reset(window)
-            label_text = window.label.ljust(label_width)
+            style = _STYLE_LUT[int(round(percent))]
+            reset_text = format_reset(window, local_tz)
             percent_text = f"{percent:>3.0f}%"
-            usage_text = format_usage_suffix(window).rjust(usage_width)
             if console.is_terminal:
-                bar = _bar_text(percent)
-                line = Text(f"{label_text} ")
-                line.append(bar)
-                line.append(" ")
-                line.append(Text(percent_text, style=usage_style(percent)))
+                filled = _bar_fill(percent)
+                # Labels and suffixes come from the API; escape them after
+                # padding so bracketed text renders literally.
+                label_text = escape(f"{window.label:<{label_width}}")
+                markup = (
+                    f"{label_text} \\[[{style}]{_BAR_FILLED[filled]}[/]"
+                    f"[bright_black]{_BAR_EMPTY[_BAR_WIDTH - filled]}[/]] "
+                    f"[{style}]{percent_text}[/]"
+                )
                 if usage_width:
-                    line.append(" ")
-                    line.append(usage_text)
-                line.append(" Resets: ")
-                line.append(reset_text)
-                console.print(line)
+                    markup += f" {escape(f'{suffixes[window]:>{usage_width}}')}"
+                markup += f" Resets: {reset_text}"
+                console.print(markup, highlight=False)
             else:
                 bar = _bar_string(percent)
-                line = f"{label_text} {bar} {percent_text}"
+                line = f"{window.label:<{label_width}} {bar} {percent_text}"
                 if usage_width:
-                    line += f" {usage_text}"
+                    line += f" {suffixes[window]:>{usage_width}}"
                 line += f" Resets: {reset_text}"
                 console.print(line)
 
 
-def format_reset(window: UsageWindow) -> str:
+def format_reset(window: UsageWindow, tz: tzinfo | None = None) -> str:
     if window.reset_at is None:
         return "n/a"
-    return window.reset_at.astimezone().strftime("%Y-%m-%d %H:%M:%S %Z")
+    local = window.reset_at.astimezone(tz)
+    tzname = local.tzname() or ""
+    return (
+        f"{local.year:04d}-{local.month:02d}-{local.day:02d} "
+        f"{local.hour:02d}:{local.minute:02d}:{local.second:02d} {tzname}"
+    )
 
 
-def _bar_string(percent: float, width: int = 28) -> str:
-    filled = int(round(width * percent / 100.0))
-    filled = max(0, min(width, filled))
-    return f"[{'#' * filled}{'-' * (width - filled)}]"
+def _bar_fill(percent: float) -> int:
+    filled = int(round(_BAR_WIDTH * percent / 100.0))
+    return max(0, min(_BAR_WIDTH, filled))
 
 
-def _bar_text(percent: float, width: int = 28) -> Text:
-    filled = int(round(width * percent / 100.0))
-    filled = max(0, min(width, filled))
-    text = Text("[")
-    if filled:
-        text.append("#" * filled, style=usage_style(percent))
-    if width - filled:
-        text.append("-" * (width - filled), style="bright_black")
-    text.append("]")
-    return text
+def _bar_string(percent: float) -> str:
+    filled = _bar_fill(percent)
+    return f"[{_BAR_FILLED[filled]}{_BAR_EMPTY[_BAR_WIDTH - filled]}]"
 
 
 def usage_style(percent: float) -> str:
@@ -85,6 +100,9 @@ def usage_style(percent: float) -> str:
     return "cyan"
 
 
+_STYLE_LUT = tuple(usage_style(float(percent)) for percent in range(101))
+
+
 def format_usage_suffix(window: UsageWindow) -> str:
     if window.used is None or window.limit is None:
         return ""
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 import subprocess
 
-from opencode_limits.cache import DEFAULT_CACHE_TTL_SECONDS
+from opencode_limits.cache import DEFAULT_CACHE_TTL_SECONDS, CachedWindow
 from opencode_limits.models import UsageWindow
 from opencode_limits.render import usage_style
 
@@ -18,15 +19,33 @@ def render_tmux_status(
     if not codex_list and copilot_window is None:
         return ""
 
-    five_hour = _find_window(codex_list, "5HR")
-    weekly = _find_window(codex_list, "Weekly")
+    by_label: dict[str, UsageWindow] = {}
+    for window in codex_list:
+        by_label.setdefault(window.label.strip().lower(), window)
+    return _render_status(by_label.get("5hr"), by_label.get("weekly"), copilot_window)
 
-    codex_icon = _styled_icon("", five_hour)
-    codex_five = _styled_percent(five_hour)
-    codex_weekly = _styled_percent(weekly)
 
-    copilot_icon = _styled_icon("", copilot_window)
-    copilot_percent = _styled_percent(copilot_window)
+def render_tmux_status_cached(
+    codex: dict[str, CachedWindow],
+    copilot: CachedWindow | None,
+) -> str:
+    if not codex and copilot is None:
+        return ""
+    return _render_status(codex.get("5HR"), codex.get("Weekly"), copilot)
+
+
+_CODEX_ICON = ""
+_COPILOT_ICON = ""
+
+
+def _render_status(
+    five_hour: UsageWindow | CachedWindow | None,
+    weekly: UsageWindow | CachedWindow | None,
+    copilot: UsageWindow | CachedWindow | None,
+) -> str:
+    codex_icon, codex_five = _style_window(_CODEX_ICON, five_hour)
+    _, codex_weekly = _style_window("", weekly)
+    copilot_icon, copilot_percent = _style_window(_COPILOT_ICON, copilot)
 
     return f"{codex_icon} {codex_five}/{codex_weekly} {copilot_icon} {copilot_percent}"
 
@@ -39,6 +58,7 @@ class CacheSettings:
     refresh: bool
 
 
+@lru_cache(maxsize=1)
 def load_cache_settings() -> CacheSettings:
     settings = CacheSettings(
         path=None,
@@ -59,31 +79,38 @@ def load_cache_settings() -> CacheSettings:
     return _merge_cache_settings(settings, env_values)
 
 
+_TMUX_OPTION_KEYS = {
+    "@opencode_limits_cache_path": "path",
+    "@opencode_limits_cache_ttl": "ttl",
+    "@opencode_limits_cache_disable": "disable",
+    "@opencode_limits_refresh": "refresh",
+}
+
+
 def _read_tmux_settings() -> dict[str, str | None]:
     if "TMUX" not in os.environ:
         return {}
-    return {
-        "path": _read_tmux_option("@opencode_limits_cache_path"),
-        "ttl": _read_tmux_option("@opencode_limits_cache_ttl"),
-        "disable": _read_tmux_option("@opencode_limits_cache_disable"),
-        "refresh": _read_tmux_option("@opencode_limits_refresh"),
-    }
-
-
-def _read_tmux_option(option: str) -> str | None:
     try:
         result = subprocess.run(
-            ["tmux", "show-option", "-gqv", option],
+            ["tmux", "show-options", "-g"],
             capture_output=True,
             text=True,
             check=False,
         )
     except FileNotFoundError:
-        return None
+        return {}
     if result.returncode != 0:
-        return None
-    value = result.stdout.strip()
-    return value or None
+        return {}
+
+    values: dict[str, str | None] = {}
+    for line in result.stdout.splitlines():
+        option, _, raw = line.partition(" ")
+        key = _TMUX_OPTION_KEYS.get(option)
+        if key is None:
+            continue
+        value = raw.strip().strip('"')
+        values[key] = value or None
+    return values
 
 
 def _merge_cache_settings(
@@ -104,15 +131,22 @@ def _merge_cache_settings(
     )
 
 
+_BOOL_MAP = {
+    "1": True,
+    "true": True,
+    "yes": True,
+    "on": True,
+    "0": False,
+    "false": False,
+    "no": False,
+    "off": False,
+}
+
+
 def _parse_bool(value: str | None, default: bool) -> bool:
     if value is None:
         return default
-    normalized = value.strip().lower()
-    if normalized in {"1", "true", "yes", "on"}:
-        return True
-    if normalized in {"0", "false", "no", "off"}:
-        return False
-    return default
+    return _BOOL_MAP.get(value.strip().lower(), default)
 
 
 def _parse_int(value: str | None, default: int) -> int:
@@ -125,30 +159,14 @@ def _parse_int(value: str | None, default: int) -> int:
     return parsed if parsed > 0 else default
 
 
-def _find_window(
-    windows: Iterable[UsageWindow],
-    label: str,
-) -> UsageWindow | None:
-    target = label.strip().lower()
-    for window in windows:
-        if window.label.strip().lower() == target:
-            return window
-    return None
-
-
-def _styled_icon(icon: str, window: UsageWindow | None) -> str:
-    if window is None:
-        return icon
-    percent = _clamp_percent(window.used_percent)
-    return _style_text(icon, usage_style(percent))
-
-
-def _styled_percent(window: UsageWindow | None) -> str:
+def _style_window(
+    icon: str, window: UsageWindow | CachedWindow | None
+) -> tuple[str, str]:
     if window is None:
-        return "--%"
-    percent = _clamp_percent(window.used_percent)
-    value = f"{int(round(percent))}%"
-    return _style_text(value, usage_style(percent))
+        return icon, "--%"
+    percent = int(round(_clamp_percent(window.used_percent)))
+    style = usage_style(percent)
+    return _style_text(icon, style), _style_text(f"{percent}%", style)
 
 
 def _clamp_percent(percent: float) -> float:
@@ -156,4 +174,4 @@ def _clamp_percent(percent: float) -> float:
 
 
 def _style_text(text: str, color: str) -> str:
-    return f"#[fg={color}]{text}#[default]"
+    return "".join(("#[fg=", color, "]", text, "#[default]"))
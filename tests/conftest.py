@@ -0,0 +1,10 @@
+import pytest
+
+from opencode_limits.tmux import load_cache_settings
+
+
+@pytest.fixture(autouse=True)
+def reset_cache_settings():
+    load_cache_settings.cache_clear()
+    yield
+    load_cache_settings.cache_clear()
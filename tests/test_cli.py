@@ -1,6 +1,7 @@
-from opencode_limits import cli
+from opencode_limits import cli, daemon
 from opencode_limits.auth import AuthTokens
 from opencode_limits.models import UsageWindow
+from opencode_limits.providers import codex, copilot
 import httpx
 
 
@@ -14,18 +15,14 @@ def test_main_returns_zero(monkeypatch) -> None:
             chatgpt_account_id="account",
         ),
     )
-    monkeypatch.setattr(
-        cli,
-        "fetch_codex_usage",
-        lambda tokens: [
-            UsageWindow(label="5h window", used_percent=0.0, reset_at=None)
-        ],
-    )
-    monkeypatch.setattr(
-        cli,
-        "fetch_copilot_usage",
-        lambda tokens: UsageWindow(label="monthly", used_percent=0.0, reset_at=None),
-    )
+    async def fake_codex(tokens, client=None):
+        return [UsageWindow(label="5h window", used_percent=0.0, reset_at=None)]
+
+    monkeypatch.setattr(codex, "fetch_codex_usage", fake_codex)
+    async def fake_copilot(tokens, client=None, github_login=None):
+        return UsageWindow(label="monthly", used_percent=0.0, reset_at=None)
+
+    monkeypatch.setattr(copilot, "fetch_copilot_usage", fake_copilot)
 
     assert cli.main([]) == 0
 
@@ -40,25 +37,23 @@ def test_main_returns_zero_when_one_provider_fails(monkeypatch) -> None:
             chatgpt_account_id="account",
         ),
     )
-    monkeypatch.setattr(
-        cli,
-        "fetch_codex_usage",
-        lambda tokens: [
-            UsageWindow(label="5h window", used_percent=0.0, reset_at=None)
-        ],
-    )
+    async def fake_codex(tokens, client=None):
+        return [UsageWindow(label="5h window", used_percent=0.0, reset_at=None)]
 
-    def _raise_error(tokens):
+    monkeypatch.setattr(codex, "fetch_codex_usage", fake_codex)
+
+    async def _raise_error(tokens, client=None, github_login=None):
         raise httpx.HTTPError("copilot failed")
 
-    monkeypatch.setattr(cli, "fetch_copilot_usage", _raise_error)
+    monkeypatch.setattr(copilot, "fetch_copilot_usage", _raise_error)
 
     assert cli.main([]) == 0
 
 
-def test_main_tmux_outputs_status(monkeypatch, capsys) -> None:
+def test_main_tmux_outputs_status(monkeypatch, capsys, tmp_path) -> None:
     monkeypatch.delenv("TMUX", raising=False)
     monkeypatch.setenv("OPENCODE_LIMITS_CACHE_DISABLE", "1")
+    monkeypatch.setattr(daemon, "socket_path", lambda: tmp_path / "daemon.sock")
     monkeypatch.setattr(
         cli,
         "load_auth",
@@ -68,19 +63,17 @@ def test_main_tmux_outputs_status(monkeypatch, capsys) -> None:
             chatgpt_account_id="account",
         ),
     )
-    monkeypatch.setattr(
-        cli,
-        "fetch_codex_usage",
-        lambda tokens: [
+    async def fake_codex(tokens, client=None):
+        return [
             UsageWindow(label="5HR", used_percent=10.0, reset_at=None),
             UsageWindow(label="Weekly", used_percent=20.0, reset_at=None),
-        ],
-    )
-    monkeypatch.setattr(
-        cli,
-        "fetch_copilot_usage",
-        lambda tokens: UsageWindow(label="monthly", used_percent=85.0, reset_at=None),
-    )
+        ]
+
+    monkeypatch.setattr(codex, "fetch_codex_usage", fake_codex)
+    async def fake_copilot(tokens, client=None, github_login=None):
+        return UsageWindow(label="monthly", used_percent=85.0, reset_at=None)
+
+    monkeypatch.setattr(copilot, "fetch_copilot_usage", fake_copilot)
 
     assert cli.main(["--tmux"]) == 0
 
@@ -92,9 +85,10 @@ def test_main_tmux_outputs_status(monkeypatch, capsys) -> None:
     )
 
 
-def test_main_tmux_returns_one_without_data(monkeypatch) -> None:
+def test_main_tmux_returns_one_without_data(monkeypatch, tmp_path) -> None:
     monkeypatch.delenv("TMUX", raising=False)
     monkeypatch.setenv("OPENCODE_LIMITS_CACHE_DISABLE", "1")
+    monkeypatch.setattr(daemon, "socket_path", lambda: tmp_path / "daemon.sock")
     monkeypatch.setattr(
         cli,
         "load_auth",
@@ -104,7 +98,13 @@ def test_main_tmux_returns_one_without_data(monkeypatch) -> None:
             chatgpt_account_id="account",
         ),
     )
-    monkeypatch.setattr(cli, "fetch_codex_usage", lambda tokens: [])
-    monkeypatch.setattr(cli, "fetch_copilot_usage", lambda tokens: None)
+    async def fake_codex(tokens, client=None):
+        return []
+
+    async def fake_copilot(tokens, client=None, github_login=None):
+        return None
+
+    monkeypatch.setattr(codex, "fetch_codex_usage", fake_codex)
+    monkeypatch.setattr(copilot, "fetch_copilot_usage", fake_copilot)
 
     assert cli.main(["--tmux"]) == 1
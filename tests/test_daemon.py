@@ -0,0 +1,37 @@
+import threading
+import time
+
+from opencode_limits import daemon
+
+
+def test_read_status_returns_none_without_daemon(tmp_path) -> None:
+    assert daemon.read_status(tmp_path / "missing.sock") is None
+
+
+def test_daemon_serves_refreshed_status(tmp_path) -> None:
+    socket_file = tmp_path / "daemon.sock"
+    stop = threading.Event()
+    server = threading.Thread(
+        target=daemon.run_daemon,
+        args=(lambda: "status-line", 3600, socket_file, stop),
+        kwargs={"fingerprint": "fp"},
+        daemon=True,
+    )
+    server.start()
+
+    try:
+        deadline = time.monotonic() + 5.0
+        status = None
+        while status is None and time.monotonic() < deadline:
+            status = daemon.read_status(socket_file)
+            if status is None:
+                time.sleep(0.01)
+        assert status == "status-line"
+        assert daemon.read_status(socket_file, fingerprint="fp") == "status-line"
+        assert daemon.read_status(socket_file, fingerprint="other") is None
+    finally:
+        stop.set()
+        server.join(timeout=5.0)
+
+    assert not server.is_alive()
+    assert not socket_file.exists()